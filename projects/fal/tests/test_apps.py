@@ -1,10 +1,12 @@
 import asyncio
 import json
+import logging
 import secrets
 import subprocess
 import time
 from contextlib import contextmanager, suppress
 from datetime import datetime
+from functools import lru_cache
 from typing import Generator, List, Tuple
 
 import fal
@@ -26,12 +28,24 @@ from openapi_fal_rest.api.applications import app_metadata
 from pydantic import BaseModel
 from pydantic import __version__ as pydantic_version
 
+IS_PYDANTIC_V2 = not pydantic_version.startswith("1.")
+
+if IS_PYDANTIC_V2:
+    from pydantic import ConfigDict
+
 
 class Input(BaseModel):
     lhs: int
     rhs: int
     wait_time: int = 0
 
+    if IS_PYDANTIC_V2:
+        model_config = ConfigDict(frozen=True)
+    else:
+
+        class Config:
+            frozen = True
+
 
 class StatefulInput(BaseModel):
     value: int
@@ -40,8 +54,19 @@ class StatefulInput(BaseModel):
 class Output(BaseModel):
     result: int
 
+    if IS_PYDANTIC_V2:
+        model_config = ConfigDict(frozen=True)
+    else:
+
+        class Config:
+            frozen = True
+
 
 actual_python = active_python()
+logger = logging.getLogger(__name__)
+
+# Every app fixture needs the current user, so only fetch it once per module.
+_get_user = lru_cache(maxsize=1)(_get_user)
 
 
 def git_revision_short_hash() -> str:
@@ -56,14 +81,14 @@ def git_revision_short_hash() -> str:
     keep_alive=60,
     machine_type=["S", "M"],
     serve=True,
-    max_concurrency=1,
+    max_concurrency=2,
     requirements=[f"pydantic=={pydantic_version}"],
 )
 def addition_app(input: Input) -> Output:
-    print("starting...")
-    for _ in range(input.wait_time):
+    logger.debug("starting...")
+    if input.wait_time:
         print("sleeping...")
-        time.sleep(1)
+        time.sleep(input.wait_time)
 
     return Output(result=input.lhs + input.rhs)
 
@@ -83,9 +108,9 @@ nomad_addition_app = addition_app.on(_scheduler="nomad")
 )
 def container_addition_app(input: Input) -> Output:
     print("starting...")
-    for _ in range(input.wait_time):
+    if input.wait_time:
         print("sleeping...")
-        time.sleep(1)
+        time.sleep(input.wait_time)
 
     return Output(result=input.lhs + input.rhs)
 
@@ -107,9 +132,9 @@ def calculator_app():
 
     def _wait(wait_time: int):
         print("starting...")
-        for _ in range(wait_time):
+        if wait_time:
             print("sleeping...")
-            time.sleep(1)
+            time.sleep(wait_time)
 
     @app.post("/add")
     def add(input: Input) -> Output:
@@ -365,17 +390,16 @@ def test_realtime_app():
 
 
 def test_app_client(test_app: str, test_nomad_app: str):
-    response = apps.run(test_app, arguments={"lhs": 1, "rhs": 2})
-    assert response["result"] == 3
-
-    response = apps.run(test_app, arguments={"lhs": 2, "rhs": 3, "wait_time": 1})
-    assert response["result"] == 5
-
-    response = apps.run(test_nomad_app, arguments={"lhs": 1, "rhs": 2})
-    assert response["result"] == 3
-
-    response = apps.run(test_nomad_app, arguments={"lhs": 2, "rhs": 3, "wait_time": 1})
-    assert response["result"] == 5
+    # The requests are independent, so submit them all up front and only
+    # then wait for the results.
+    handles = [
+        apps.submit(test_app, arguments={"lhs": 1, "rhs": 2}),
+        apps.submit(test_app, arguments={"lhs": 2, "rhs": 3, "wait_time": 1}),
+        apps.submit(test_nomad_app, arguments={"lhs": 1, "rhs": 2}),
+        apps.submit(test_nomad_app, arguments={"lhs": 2, "rhs": 3, "wait_time": 1}),
+    ]
+    results = [handle.get()["result"] for handle in handles]
+    assert results == [3, 5, 3, 5]
 
 
 def test_app_client_old_format(test_app: str):